@@ -16,6 +16,7 @@ from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 import boto3
 from botocore.config import Config as BotoConfig
+from botocore.exceptions import ClientError
 from datetime import datetime, timezone
 from decimal import Decimal
 from boto3.dynamodb.conditions import Key
@@ -275,13 +276,17 @@ def list_organizations(event, **kwargs):
     if error:
         return error
 
-    result = table.query(
+    # METADATA items carry more than the list view shows; fetch only its columns.
+    items = _query_all(
+        table,
         IndexName='gsi1',
-        KeyConditionExpression=Key('gsi1pk').eq('ORG_METADATA')
+        KeyConditionExpression=Key('gsi1pk').eq('ORG_METADATA'),
+        ProjectionExpression='organization_id, organization_name, enabled, '
+                             's3_bucket_name, created_at, updated_at',
     )
 
     orgs = []
-    for item in result.get('Items', []):
+    for item in items:
         orgs.append({
             'organization_id': item.get('organization_id'),
             'organization_name': item.get('organization_name'),
@@ -358,13 +363,14 @@ def list_rules(event, path_params, **kwargs):
     if error:
         return error
 
-    result = table.query(
+    items = _query_all(
+        table,
         KeyConditionExpression=Key('pk').eq(f'ORG#{org_id}') & Key('sk').begins_with('RULE#')
     )
 
     allowed = perms_module.viewable_categories(claims, org_id)
     rules = []
-    for item in result.get('Items', []):
+    for item in items:
         if item.get('category') not in allowed:
             continue
         rules.append(format_rule(item))
@@ -428,23 +434,17 @@ def create_rule(event, path_params, body, **kwargs):
         })
 
     rule_id = body['id']
-
-    # Check if rule already exists
-    existing = table.get_item(
-        Key={'pk': f'ORG#{org_id}', 'sk': f'RULE#{rule_id}'}
-    )
-    if 'Item' in existing:
-        return response(409, {'error': f'Rule {rule_id} already exists. Use PUT to update.'})
-
     version = body.get('version', '1.0.0')
     now = datetime.utcnow().isoformat() + 'Z'
+    pk = f'ORG#{org_id}'
+    sk = f'RULE#{rule_id}'
 
     # New flat schema - no llm_config, no GSI2
     item = {
-        'pk': f'ORG#{org_id}',
-        'sk': f'RULE#{rule_id}',
+        'pk': pk,
+        'sk': sk,
         'gsi1pk': 'RULE',
-        'gsi1sk': f'ORG#{org_id}#RULE#{rule_id}',
+        'gsi1sk': f'{pk}#{sk}',
         'rule_id': rule_id,
         'name': body['name'],
         'category': body['category'],
@@ -463,12 +463,24 @@ def create_rule(event, path_params, body, **kwargs):
         'updated_at': now,
     }
 
-    table.put_item(Item=item)
+    # The condition makes the existence check and the write one atomic call.
+    try:
+        table.put_item(Item=item, ConditionExpression='attribute_not_exists(sk)')
+    except ClientError as e:
+        if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
+            return response(409, {'error': f'Rule {rule_id} already exists. Use PUT to update.'})
+        raise
     print(f"Created rule {rule_id} for {org_id}")
 
     return response(201, format_rule(item))
 
 
+RULE_UPDATE_FIELDS = (
+    'name', 'category', 'description', 'enabled', 'type', 'version', 'rule_text',
+    'fields_to_extract', 'notes', 'conditions', 'conditionals', 'logic', 'fail_message',
+)
+
+
 def update_rule(event, path_params, body, **kwargs):
     """Update an existing rule"""
     org_id = path_params.get('orgId')
@@ -490,46 +502,33 @@ def update_rule(event, path_params, body, **kwargs):
             'error': f'Invalid category. Must be one of: {perms_module.CATEGORIES}'
         })
 
-    # Get existing rule
-    existing_result = table.get_item(
-        Key={'pk': f'ORG#{org_id}', 'sk': f'RULE#{rule_id}'}
-    )
-
-    if 'Item' not in existing_result:
-        return response(404, {'error': f'Rule not found: {rule_id}'})
-
-    existing = existing_result['Item']
-    version = body.get('version', existing.get('version', '1.0.0'))
-
-    # New flat schema - no llm_config, no GSI2
-    item = {
-        'pk': f'ORG#{org_id}',
-        'sk': f'RULE#{rule_id}',
-        'gsi1pk': 'RULE',
-        'gsi1sk': f'ORG#{org_id}#RULE#{rule_id}',
-        'rule_id': rule_id,
-        'name': body.get('name', existing.get('name')),
-        'category': body.get('category', existing.get('category')),
-        'description': body.get('description', existing.get('description', '')),
-        'enabled': body.get('enabled', existing.get('enabled', True)),
-        'type': body.get('type', existing.get('type', 'llm')),
-        'version': version,
-        'rule_text': body.get('rule_text', existing.get('rule_text', '')),
-        'fields_to_extract': body.get('fields_to_extract', existing.get('fields_to_extract', [])),
-        'notes': body.get('notes', existing.get('notes', [])),
-        # Deterministic rule fields
-        'conditions': body.get('conditions', existing.get('conditions', [])),
-        'conditionals': body.get('conditionals', existing.get('conditionals', [])),
-        'logic': body.get('logic', existing.get('logic', 'all')),
-        'fail_message': body.get('fail_message', existing.get('fail_message', '')),
-        'created_at': existing.get('created_at', datetime.utcnow().isoformat() + 'Z'),
-        'updated_at': datetime.utcnow().isoformat() + 'Z',
-    }
-
-    table.put_item(Item=item)
+    # One conditional UpdateItem: only the fields in the body change, and
+    # created_at is set only if an older item somehow lacks it.
+    fields = [f for f in RULE_UPDATE_FIELDS if f in body]
+    now = datetime.utcnow().isoformat() + 'Z'
+    try:
+        result = table.update_item(
+            Key={'pk': f'ORG#{org_id}', 'sk': f'RULE#{rule_id}'},
+            UpdateExpression='SET ' + ', '.join(
+                [f'#{f} = :{f}' for f in fields]
+                + ['#updated_at = :now', '#created_at = if_not_exists(#created_at, :now)']
+            ),
+            ConditionExpression='attribute_exists(sk)',
+            ExpressionAttributeNames={
+                **{f'#{f}': f for f in fields},
+                '#updated_at': 'updated_at',
+                '#created_at': 'created_at',
+            },
+            ExpressionAttributeValues={**{f':{f}': body[f] for f in fields}, ':now': now},
+            ReturnValues='ALL_NEW',
+        )
+    except ClientError as e:
+        if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
+            return response(404, {'error': f'Rule not found: {rule_id}'})
+        raise
     print(f"Updated rule {rule_id} for {org_id}")
 
-    return response(200, format_rule(item))
+    return response(200, format_rule(result['Attributes']))
 
 
 # ---- Rules Config (field_mappings) ----
@@ -580,31 +579,32 @@ def update_rules_config(event, path_params, body, **kwargs):
     if 'field_mappings' not in body and 'csv_column_mappings' not in body:
         return response(400, {'error': 'Request body must include field_mappings or csv_column_mappings'})
 
-    # Get existing config to preserve fields not being updated
-    existing_result = table.get_item(
-        Key={'pk': f'ORG#{org_id}', 'sk': 'RULES_CONFIG'}
+    # SET only the mappings in the body; the other one stays as stored.
+    mappings = [k for k in ('field_mappings', 'csv_column_mappings') if k in body]
+    result = table.update_item(
+        Key={'pk': f'ORG#{org_id}', 'sk': 'RULES_CONFIG'},
+        UpdateExpression='SET ' + ', '.join(
+            [f'{k} = :{k}' for k in mappings]
+            + ['gsi1pk = :gsi1pk', 'gsi1sk = :gsi1sk', 'organization_id = :org_id',
+               'version = :version', 'updated_at = :updated_at']
+        ),
+        ExpressionAttributeValues={
+            **{f':{k}': body[k] for k in mappings},
+            ':gsi1pk': 'RULES_CONFIG',
+            ':gsi1sk': f'ORG#{org_id}',
+            ':org_id': org_id,
+            ':version': body.get('version', '1.0.0'),
+            ':updated_at': datetime.utcnow().isoformat() + 'Z',
+        },
+        ReturnValues='ALL_NEW',
     )
-    existing = existing_result.get('Item', {})
-
-    item = {
-        'pk': f'ORG#{org_id}',
-        'sk': 'RULES_CONFIG',
-        'gsi1pk': 'RULES_CONFIG',
-        'gsi1sk': f'ORG#{org_id}',
-        'organization_id': org_id,
-        'field_mappings': body.get('field_mappings', existing.get('field_mappings', {})),
-        'csv_column_mappings': body.get('csv_column_mappings', existing.get('csv_column_mappings', {})),
-        'version': body.get('version', '1.0.0'),
-        'updated_at': datetime.utcnow().isoformat() + 'Z',
-    }
-
-    table.put_item(Item=item)
+    item = result['Attributes']
     print(f"Updated rules config for {org_id}")
 
     return response(200, {
         'organization_id': org_id,
-        'field_mappings': item['field_mappings'],
-        'csv_column_mappings': item['csv_column_mappings'],
+        'field_mappings': item.get('field_mappings', {}),
+        'csv_column_mappings': item.get('csv_column_mappings', {}),
         'version': item['version'],
         'updated_at': item['updated_at'],
     })
@@ -281,10 +281,10 @@ def _load_org_metadata(org_id: str) -> Optional[dict]:
     fname = _METADATA_FILES.get(org_id)
     if not fname:
         return None
-    path = _METADATA_DIR / fname
-    if not path.exists():
+    try:
+        data = json.loads((_METADATA_DIR / fname).read_text())
+    except FileNotFoundError:
         return None
-    data = json.loads(path.read_text())
     # Re-key columns by Athena name so lookups in _build_org_schemas are O(1).
     by_athena = {}
     for entry in data.get("columns", []):
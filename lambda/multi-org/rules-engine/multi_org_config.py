@@ -13,6 +13,8 @@ Functions:
 - build_env_config(org_id) - Build Lambda env_config dict
 """
 
+import time
+
 import boto3
 from functools import lru_cache
 from boto3.dynamodb.conditions import Key
@@ -20,6 +22,24 @@ from boto3.dynamodb.conditions import Key
 dynamodb = boto3.resource('dynamodb')
 table = dynamodb.Table('penguin-health-org-config')
 
+_CACHE_TTL_SECONDS = 300
+_chart_config_cache = {}
+
+
+def _query_all(**kwargs):
+    """Query the org-config table, following LastEvaluatedKey to the end.
+
+    A single Query() returns at most 1 MB; an org with long rule prompts
+    would otherwise load a silently truncated rule set.
+    """
+    items = []
+    while True:
+        response = table.query(**kwargs)
+        items.extend(response['Items'])
+        if 'LastEvaluatedKey' not in response:
+            return items
+        kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
 
 @lru_cache(maxsize=100)
 def get_organization(org_id):
@@ -89,12 +109,10 @@ def load_org_rules(org_id):
     """
     try:
         # Query all rules for this organization
-        response = table.query(
+        rules = _query_all(
             KeyConditionExpression=Key('pk').eq(f'ORG#{org_id}') & Key('sk').begins_with('RULE#')
         )
 
-        rules = response['Items']
-
         # Filter to only enabled rules
         enabled_rules = [rule for rule in rules if rule.get('enabled', True)]
 
@@ -224,6 +242,26 @@ def load_irp_config(org_id):
         return None
 
 
+def _now():
+    return time.monotonic()
+
+
+def _get_chart_config_item(org_id):
+    """Fetch the org's CHART_CONFIG item, or None.
+
+    Found items are cached for _CACHE_TTL_SECONDS; a missing item is not
+    cached, so a newly added config is used on the next call.
+    """
+    cached = _chart_config_cache.get(org_id)
+    if cached is not None and _now() < cached[0]:
+        return cached[1]
+
+    item = table.get_item(Key={'pk': f'ORG#{org_id}', 'sk': 'CHART_CONFIG'}).get('Item')
+    if item is not None:
+        _chart_config_cache[org_id] = (_now() + _CACHE_TTL_SECONDS, item)
+    return item
+
+
 def load_chart_config(org_id):
     """
     Load chart processing configuration for an organization
@@ -245,12 +283,9 @@ def load_chart_config(org_id):
         }
     """
     try:
-        response = table.get_item(
-            Key={'pk': f'ORG#{org_id}', 'sk': 'CHART_CONFIG'}
-        )
+        chart_config = _get_chart_config_item(org_id)
 
-        if 'Item' in response:
-            chart_config = response['Item']
+        if chart_config is not None:
             print(f"Loaded chart config for {org_id}")
             return chart_config
 
@@ -355,12 +390,10 @@ def list_all_organizations():
         ]
     """
     try:
-        response = table.query(
+        orgs = _query_all(
             IndexName='gsi1',
             KeyConditionExpression=Key('gsi1pk').eq('ORG_METADATA')
         )
-
-        orgs = response['Items']
         print(f"Found {len(orgs)} organizations")
         return orgs
 
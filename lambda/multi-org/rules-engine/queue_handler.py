@@ -26,12 +26,14 @@ from decimal import Decimal
 from typing import Any, Iterable, Optional
 
 import boto3
+from botocore.config import Config as BotoConfig
 from botocore.exceptions import ClientError
 
 from audit import SystemPrincipal, emit as audit_emit
 
 
-_dynamodb = boto3.resource("dynamodb")
+# Pointer reads/writes happen on each of the rules engine's file workers.
+_dynamodb = boto3.resource("dynamodb", config=BotoConfig(max_pool_connections=25))
 
 _AUDIT_PRINCIPAL = SystemPrincipal(
     os.environ.get("RULES_ENGINE_TASK_NAME", "rules-engine-rag")
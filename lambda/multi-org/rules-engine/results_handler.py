@@ -16,10 +16,12 @@ from datetime import datetime
 from decimal import Decimal
 
 import boto3
+from botocore.config import Config as BotoConfig
 
 from audit import SystemPrincipal, emit as audit_emit
 
-dynamodb = boto3.resource('dynamodb')
+# Shared by every concurrent file worker in rules_engine_rag.
+dynamodb = boto3.resource('dynamodb', config=BotoConfig(max_pool_connections=25))
 s3_client = boto3.client('s3')
 
 _AUDIT_PRINCIPAL = SystemPrincipal(
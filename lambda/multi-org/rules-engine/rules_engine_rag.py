@@ -20,6 +20,7 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta, timezone
 
 import boto3
+from botocore.config import Config as BotoConfig
 
 from audit import SystemPrincipal, emit as audit_emit
 from multi_org_config import load_org_rules, build_env_config
@@ -70,7 +71,8 @@ class _NullContext:
 
 _NULL_CTX = _NullContext()
 
-s3_client = boto3.client('s3')
+# Sized above _FILE_WORKERS_DEFAULT; every file worker reads through this client.
+s3_client = boto3.client('s3', config=BotoConfig(max_pool_connections=25))
 
 
 def _notify_validation_run_complete(org_id, validation_run_id, summary,
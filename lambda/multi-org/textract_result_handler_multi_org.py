@@ -142,7 +142,7 @@ def get_job_metadata(job_id, bucket_name):
                     Bucket=bucket_name,
                     Key=obj['Key']
                 )
-                metadata = json.loads(metadata_obj['Body'].read().decode('utf-8'))
+                metadata = json.loads(metadata_obj['Body'].read())
 
                 if metadata.get('job_id') == job_id:
                     print(f"Found metadata for job {job_id}: {obj['Key']}")
@@ -468,7 +468,6 @@ def process_textract_response(response):
     """
     extracted_data = {
         'text': '',
-        'lines': [],
         'metadata': {
             'document_pages': response.get('DocumentMetadata', {}).get('Pages', 0),
             'extraction_timestamp': datetime.utcnow().isoformat(),
@@ -476,40 +475,37 @@ def process_textract_response(response):
         }
     }
 
+    # Id -> Text for WORD blocks only
     blocks_map = {}
+    word_text = {}
     for block in response['Blocks']:
         blocks_map[block['Id']] = block
+        if block['BlockType'] == 'WORD':
+            word_text[block['Id']] = block['Text']
 
-    # Extract key-value pairs from FORMS for structured data
+    # Forms are (page, top, key, value) tuples; lines are (page, top, text)
     form_pairs = []
     for block in response['Blocks']:
-        if block['BlockType'] == 'KEY_VALUE_SET' and block.get('EntityTypes') and 'KEY' in block['EntityTypes']:
-            key_text = get_text_from_block(block, blocks_map)
+        if block['BlockType'] != 'KEY_VALUE_SET':
+            continue
+        entity_types = block.get('EntityTypes')
+        if entity_types and 'KEY' in entity_types:
+            key_text = get_text_from_block(block, word_text)
             value_block = get_value_block(block, blocks_map)
-            value_text = get_text_from_block(value_block, blocks_map) if value_block else ''
+            value_text = get_text_from_block(value_block, word_text) if value_block else ''
 
             if key_text:
-                page = block.get('Page', 1)
-                y_pos = block.get('Geometry', {}).get('BoundingBox', {}).get('Top', 0)
-                form_pairs.append({
-                    'key': key_text,
-                    'value': value_text,
-                    'page': page,
-                    'y_position': y_pos
-                })
+                form_pairs.append((block['Page'], block['Geometry']['BoundingBox']['Top'], key_text, value_text))
 
     # Sort by page and Y-position
-    form_pairs.sort(key=lambda x: (x['page'], x['y_position']))
+    form_pairs.sort(key=lambda pair: pair[:2])
 
     # Build formatted text from forms (key: value format) if available
     if form_pairs:
-        text_lines = []
-        for pair in form_pairs:
-            if pair['value']:
-                text_lines.append(f"{pair['key']} {pair['value']}")
-            else:
-                text_lines.append(pair['key'])
-        forms_text = '\n'.join(text_lines)
+        forms_text = '\n'.join(
+            f"{key} {value}" if value else key
+            for _, _, key, value in form_pairs
+        )
         print(f"Extracted {len(form_pairs)} form key-value pairs")
     else:
         forms_text = ''
@@ -518,18 +514,11 @@ def process_textract_response(response):
     lines = []
     for block in response['Blocks']:
         if block['BlockType'] == 'LINE':
-            page = block.get('Page', 1)
-            y_pos = block.get('Geometry', {}).get('BoundingBox', {}).get('Top', 0)
-            lines.append({
-                'text': block['Text'],
-                'page': page,
-                'y_position': y_pos
-            })
+            lines.append((block['Page'], block['Geometry']['BoundingBox']['Top'], block['Text']))
 
     # Sort by page and Y-position to maintain reading order
-    lines.sort(key=lambda x: (x['page'], x['y_position']))
-    lines_text = '\n'.join([line['text'] for line in lines])
-    extracted_data['lines'] = lines
+    lines.sort(key=lambda line: line[:2])
+    lines_text = '\n'.join(text for _, _, text in lines)
     print(f"Extracted {len(lines)} text lines from LINE blocks")
 
     # Use FORMS text if available (better formatting), otherwise use LINE text
@@ -541,20 +530,16 @@ def process_textract_response(response):
     return extracted_data
 
 
-def get_text_from_block(block, blocks_map):
-    """Get text from a block by following CHILD relationships"""
+def get_text_from_block(block, word_text):
+    """Get text from a block by joining its CHILD WORD blocks (word_text: Id -> Text)"""
     if not block:
         return ''
 
-    text = ''
-    if 'Relationships' in block:
-        for relationship in block['Relationships']:
-            if relationship['Type'] == 'CHILD':
-                for child_id in relationship['Ids']:
-                    child = blocks_map.get(child_id)
-                    if child and child['BlockType'] == 'WORD':
-                        text += child['Text'] + ' '
-    return text.strip()
+    words = []
+    for relationship in block.get('Relationships', []):
+        if relationship['Type'] == 'CHILD':
+            words.extend(word_text[child_id] for child_id in relationship['Ids'] if child_id in word_text)
+    return ' '.join(words)
 
 
 def get_value_block(key_block, blocks_map):
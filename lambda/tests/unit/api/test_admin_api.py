@@ -228,6 +228,36 @@ class TestRuleCRUD:
         rule_ids = [r['rule_id'] for r in body['rules']]
         assert 'rule-001' in rule_ids
 
+    def test_list_rules_returns_all_pages(
+        self, mock_dynamodb, sample_org_config, super_admin_event, monkeypatch
+    ):
+        """list_rules must walk LastEvaluatedKey; orgs with long rule prompts
+        overflow the 1 MB first page."""
+        from api.admin_api import list_rules
+        import api.admin_api as admin_api
+
+        def _rule(rule_id):
+            return {'rule_id': rule_id, 'name': rule_id, 'category': 'Compliance Audit'}
+
+        responses = iter([
+            {'Items': [_rule('r1'), _rule('r2')],
+             'LastEvaluatedKey': {'pk': 'ORG#test-org', 'sk': 'RULE#r2'}},
+            {'Items': [_rule('r3')]},
+        ])
+
+        class PagedTable:
+            def query(self, **kwargs):
+                return next(responses)
+
+        monkeypatch.setattr(admin_api, 'table', PagedTable())
+
+        resp = list_rules(event=super_admin_event, path_params={'orgId': 'test-org'})
+
+        assert resp['statusCode'] == 200
+        body = json.loads(resp['body'])
+        assert [r['rule_id'] for r in body['rules']] == ['r1', 'r2', 'r3']
+        assert body['count'] == 3
+
     def test_get_rule(self, mock_dynamodb, sample_org_config, super_admin_event):
         """Should get a specific rule."""
         from api.admin_api import get_rule
@@ -306,6 +336,70 @@ class TestRuleCRUD:
         response_body = json.loads(response['body'])
         assert 'already exists' in response_body['error']
 
+        # The conditional write must leave the stored rule untouched.
+        stored = mock_dynamodb.Table('penguin-health-org-config').get_item(
+            Key={'pk': 'ORG#test-org', 'sk': 'RULE#rule-001'}
+        )['Item']
+        assert stored['name'] != 'Duplicate Rule'
+
+    def test_update_rule_changes_only_given_fields(self, mock_dynamodb, sample_org_config, super_admin_event):
+        """A partial PUT must keep every attribute the body does not mention."""
+        from api.admin_api import update_rule
+
+        response = update_rule(
+            event=super_admin_event,
+            path_params={'orgId': 'test-org', 'ruleId': 'rule-001'},
+            body={'name': 'Renamed', 'enabled': False},
+        )
+
+        assert response['statusCode'] == 200
+        body = json.loads(response['body'])
+        assert body['name'] == 'Renamed'
+        assert body['enabled'] is False
+        assert body['rule_text'] == 'Verify the service date is documented in the chart.'
+        assert body['created_at'] == body['updated_at']
+
+    def test_update_rule_keeps_existing_created_at(self, mock_dynamodb, sample_org_config, super_admin_event):
+        """created_at survives a partial PUT; updated_at moves."""
+        from api.admin_api import update_rule
+
+        table = mock_dynamodb.Table('penguin-health-org-config')
+        table.update_item(
+            Key={'pk': 'ORG#test-org', 'sk': 'RULE#rule-001'},
+            UpdateExpression='SET created_at = :ts, updated_at = :ts',
+            ExpressionAttributeValues={':ts': '2024-01-01T00:00:00Z'},
+        )
+
+        response = update_rule(
+            event=super_admin_event,
+            path_params={'orgId': 'test-org', 'ruleId': 'rule-001'},
+            body={'description': 'Updated description'},
+        )
+
+        assert response['statusCode'] == 200
+        stored = table.get_item(Key={'pk': 'ORG#test-org', 'sk': 'RULE#rule-001'})['Item']
+        assert stored['created_at'] == '2024-01-01T00:00:00Z'
+        assert stored['updated_at'] != '2024-01-01T00:00:00Z'
+        assert stored['description'] == 'Updated description'
+        assert stored['fields_to_extract'] == [
+            {'name': 'service_date', 'type': 'datetime', 'description': 'Date of service'}
+        ]
+
+    def test_update_rule_not_found(self, mock_dynamodb, sample_org_config, super_admin_event):
+        """Updating a missing rule returns 404 and does not create it."""
+        from api.admin_api import update_rule
+
+        response = update_rule(
+            event=super_admin_event,
+            path_params={'orgId': 'test-org', 'ruleId': 'nonexistent-rule'},
+            body={'name': 'Ghost'},
+        )
+
+        assert response['statusCode'] == 404
+        assert 'Item' not in mock_dynamodb.Table('penguin-health-org-config').get_item(
+            Key={'pk': 'ORG#test-org', 'sk': 'RULE#nonexistent-rule'}
+        )
+
     def test_create_deterministic_rule_without_rule_text(self, mock_dynamodb, sample_org_config, super_admin_event):
         """Deterministic rules should not require rule_text."""
         from api.admin_api import create_rule
@@ -327,6 +421,25 @@ class TestRuleCRUD:
         assert response['statusCode'] == 201
 
 
+class TestRulesConfig:
+    """Test rules config (field_mappings / csv_column_mappings) updates."""
+
+    def test_update_keeps_mapping_not_in_body(self, mock_dynamodb, sample_org_config, super_admin_event):
+        from api.admin_api import update_rules_config
+
+        response = update_rules_config(
+            event=super_admin_event,
+            path_params={'orgId': 'test-org'},
+            body={'csv_column_mappings': {'service_id': 'Service_ID'}},
+        )
+
+        assert response['statusCode'] == 200
+        body = json.loads(response['body'])
+        assert body['csv_column_mappings'] == {'service_id': 'Service_ID'}
+        assert body['field_mappings'] == {'document_id': 'Consumer Service ID:'}
+        assert body['version'] == '1.0.0'
+
+
 class TestLambdaHandler:
     """Test the main lambda_handler routing."""
 
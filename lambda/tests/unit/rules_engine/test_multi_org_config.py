@@ -0,0 +1,99 @@
+"""Regression tests for `multi_org_config` DynamoDB reads.
+
+DynamoDB caps a single Query response at 1 MB. An org whose rules carry
+long prompts spills onto a second page; load_org_rules must walk
+LastEvaluatedKey or the rules engine silently validates against a
+partial rule set.
+"""
+
+import os
+import sys
+
+sys.path.insert(
+    0,
+    os.path.join(
+        os.path.dirname(__file__), '..', '..', '..', 'multi-org', 'rules-engine',
+    ),
+)
+
+
+def test_load_org_rules_walks_all_pages(monkeypatch):
+    import multi_org_config
+
+    pages = [
+        {'Items': [{'rule_id': '1'}, {'rule_id': '2', 'enabled': False}],
+         'LastEvaluatedKey': {'pk': 'ORG#org', 'sk': 'RULE#2'}},
+        {'Items': [{'rule_id': '3'}]},
+    ]
+    call_log = []
+
+    class FakeTable:
+        def query(self, **kwargs):
+            call_log.append(kwargs)
+            return pages[len(call_log) - 1]
+
+        def get_item(self, **kwargs):
+            return {}
+
+    monkeypatch.setattr(multi_org_config, 'table', FakeTable())
+
+    config = multi_org_config.load_org_rules('org')
+
+    assert [r['rule_id'] for r in config['rules']] == ['1', '3']
+    assert 'ExclusiveStartKey' not in call_log[0]
+    assert call_log[1]['ExclusiveStartKey'] == {'pk': 'ORG#org', 'sk': 'RULE#2'}
+
+
+
+def _chart_config_table(monkeypatch, item):
+    import multi_org_config
+
+    call_log = []
+
+    class FakeTable:
+        def get_item(self, **kwargs):
+            call_log.append(kwargs['Key'])
+            return {'Item': item} if item is not None else {}
+
+    monkeypatch.setattr(multi_org_config, 'table', FakeTable())
+    monkeypatch.setattr(multi_org_config, '_chart_config_cache', {})
+    return call_log
+
+
+def test_load_chart_config_reads_each_org_once(monkeypatch):
+    import multi_org_config
+
+    call_log = _chart_config_table(monkeypatch, {'encounter_delimiter': 'Visit:'})
+
+    first = multi_org_config.load_chart_config('org')
+    second = multi_org_config.load_chart_config('org')
+
+    assert first == second == {'encounter_delimiter': 'Visit:'}
+    assert call_log == [{'pk': 'ORG#org', 'sk': 'CHART_CONFIG'}]
+
+
+def test_load_chart_config_refetches_after_ttl(monkeypatch):
+    import multi_org_config
+
+    call_log = _chart_config_table(monkeypatch, {'encounter_delimiter': 'Visit:'})
+    clock = [1000.0]
+    monkeypatch.setattr(multi_org_config, '_now', lambda: clock[0])
+
+    multi_org_config.load_chart_config('org')
+    clock[0] += multi_org_config._CACHE_TTL_SECONDS + 1
+    multi_org_config.load_chart_config('org')
+
+    assert len(call_log) == 2
+
+
+def test_load_chart_config_does_not_cache_missing_config(monkeypatch):
+    """An org without CHART_CONFIG picks up one added later on the next call."""
+    import multi_org_config
+
+    call_log = _chart_config_table(monkeypatch, None)
+
+    first = multi_org_config.load_chart_config('org')
+    second = multi_org_config.load_chart_config('org')
+
+    assert first['encounter_delimiter'] == second['encounter_delimiter'] == 'Consumer Service ID:'
+    assert len(call_log) == 2
@@ -153,6 +153,7 @@ def test_seed_script_rule_item_shape():
         rule=rule,
         category=seed['category'],
         version=seed['version'],
+        now='2026-01-01T00:00:00Z',
     )
 
     # The keys admin_api.py writes — must all be present
@@ -169,3 +170,32 @@ def test_seed_script_rule_item_shape():
     assert item['sk'].startswith('RULE#')
     assert item['gsi1pk'] == 'RULE'
     assert item['gsi1sk'].startswith('ORG#supportive-care#RULE#')
+    assert item['created_at'] == item['updated_at'] == '2026-01-01T00:00:00Z'
+
+
+def test_seed_script_writes_every_rule(mock_dynamodb, capsys):
+    """Apply path: every seed rule lands as its own item via the batch writer."""
+    mod = _load_seed_script_module()
+    rc = mod.main(['--region', 'us-east-1'])
+    assert rc == 0
+
+    table = mock_dynamodb.Table('penguin-health-org-config')
+    items = table.scan()['Items']
+    seed = _load_seed()
+    assert {i['sk'] for i in items} == {f"RULE#{r['id']}" for r in seed['rules']}
+    assert all(i['pk'] == 'ORG#supportive-care' for i in items)
+    assert f"Upserted {len(seed['rules'])} rules" in capsys.readouterr().out
+
+
+def test_seed_script_rejects_invalid_rules_before_writing(mock_dynamodb, tmp_path, capsys):
+    seed = _load_seed()
+    del seed['rules'][5]['type']
+    seed_file = tmp_path / 'seed.json'
+    seed_file.write_text(json.dumps(seed))
+
+    mod = _load_seed_script_module()
+    rc = mod.main(['--seed-file', str(seed_file)])
+
+    assert rc == 1
+    assert mock_dynamodb.Table('penguin-health-org-config').scan()['Items'] == []
+    assert str(seed['rules'][5]['id']) in capsys.readouterr().err
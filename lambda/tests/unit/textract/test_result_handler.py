@@ -0,0 +1,102 @@
+"""
+Tests for textract_result_handler_multi_org.process_textract_response.
+
+Covers the Textract Blocks → extracted_data shape the encounter splitter
+depends on: FORMS key/value text, LINE text, and reading order.
+"""
+
+import textract_result_handler_multi_org as handler
+
+
+def _word(block_id, text):
+    return {'Id': block_id, 'BlockType': 'WORD', 'Text': text}
+
+
+def _key(block_id, word_ids, value_id, page=1, top=0.0):
+    return {
+        'Id': block_id,
+        'BlockType': 'KEY_VALUE_SET',
+        'EntityTypes': ['KEY'],
+        'Confidence': 99.0,
+        'Page': page,
+        'Geometry': {'BoundingBox': {'Top': top}},
+        'Relationships': [
+            {'Type': 'VALUE', 'Ids': [value_id]},
+            {'Type': 'CHILD', 'Ids': word_ids},
+        ],
+    }
+
+
+def _value(block_id, word_ids, page=1, top=0.0):
+    return {
+        'Id': block_id,
+        'BlockType': 'KEY_VALUE_SET',
+        'EntityTypes': ['VALUE'],
+        'Confidence': 99.0,
+        'Page': page,
+        'Geometry': {'BoundingBox': {'Top': top}},
+        'Relationships': [{'Type': 'CHILD', 'Ids': word_ids}],
+    }
+
+
+def _line(block_id, text, page=1, top=0.0):
+    return {
+        'Id': block_id,
+        'BlockType': 'LINE',
+        'Text': text,
+        'Page': page,
+        'Geometry': {'BoundingBox': {'Top': top}},
+    }
+
+
+def _response(blocks):
+    return {
+        'Blocks': blocks,
+        'JobStatus': 'SUCCEEDED',
+        'DocumentMetadata': {'Pages': 2},
+    }
+
+
+def test_forms_text_joins_child_words_in_reading_order():
+    blocks = [
+        _word('w1', 'Consumer'), _word('w2', 'Service'), _word('w3', 'ID:'),
+        _word('w4', '12345'),
+        _word('w5', 'Program:'), _word('w6', 'Outpatient'),
+        # Page 2 key listed first in the response; must sort after page 1.
+        _key('k2', ['w5'], 'v2', page=2, top=0.1),
+        _value('v2', ['w6'], page=2, top=0.1),
+        _key('k1', ['w1', 'w2', 'w3'], 'v1', page=1, top=0.5),
+        _value('v1', ['w4'], page=1, top=0.5),
+    ]
+
+    data = handler.process_textract_response(_response(blocks))
+
+    assert data['text'] == 'Consumer Service ID: 12345\nProgram: Outpatient'
+    assert data['metadata']['document_pages'] == 2
+
+
+def test_child_ids_that_are_not_words_are_skipped():
+    """SELECTION_ELEMENT children (checkboxes) carry no Text."""
+    blocks = [
+        _word('w1', 'Signed:'),
+        {'Id': 's1', 'BlockType': 'SELECTION_ELEMENT', 'SelectionStatus': 'SELECTED'},
+        _key('k1', ['w1', 's1'], 'v1'),
+        _value('v1', ['s1']),
+    ]
+
+    data = handler.process_textract_response(_response(blocks))
+
+    assert data['text'] == 'Signed:'
+
+
+def test_falls_back_to_line_text_without_forms():
+    blocks = [
+        _line('l2', 'second', page=1, top=0.9),
+        _line('l3', 'third', page=2, top=0.1),
+        _line('l1', 'first', page=1, top=0.2),
+    ]
+
+    data = handler.process_textract_response(_response(blocks))
+
+    assert data['lines_text'] == 'first\nsecond\nthird'
+    assert data['text'] == data['lines_text']
@@ -5,7 +5,11 @@ Reads `scripts/multi-org/rule-seeds/supportive-care-aba.json` and writes one
 DynamoDB item per rule to `penguin-health-org-config` under
   pk = ORG#<org_id>, sk = RULE#<rule_id>
 
-Idempotent: re-running overwrites existing rule items (boto3 PutItem).
+Idempotent: re-running overwrites existing rule items. Writes go through
+boto3's `batch_writer` (25 rules per `BatchWriteItem` call).
+
+Every rule must carry id, name, and type; the script exits non-zero
+without writing anything if any rule is missing one.
 
 Prereqs:
   - scripts/multi-org/create-organization.sh has already created the org's
@@ -29,6 +33,7 @@ import sys
 from datetime import datetime, timezone
 
 import boto3
+from botocore.config import Config
 
 
 TABLE_NAME = "penguin-health-org-config"
@@ -37,21 +42,26 @@ DEFAULT_SEED = os.path.join(
     "rule-seeds",
     "supportive-care-aba.json",
 )
+# batch_writer re-queues UnprocessedItems on its own; adaptive retries add
+# client-side backoff when the table throttles the resubmitted batches.
+BOTO_CONFIG = Config(retries={"mode": "adaptive", "max_attempts": 10})
+REQUIRED_RULE_FIELDS = ("id", "name", "type")
 
 
 def _now_iso() -> str:
     return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
 
 
-def _rule_item(*, org_id: str, rule: dict, category: str, version: str) -> dict:
+def _rule_item(*, org_id: str, rule: dict, category: str, version: str, now: str) -> dict:
     """Shape a seed-file rule into the DynamoDB item format used by admin_api."""
-    now = _now_iso()
     rule_id = str(rule["id"])
+    pk = f"ORG#{org_id}"
+    sk = f"RULE#{rule_id}"
     return {
-        "pk": f"ORG#{org_id}",
-        "sk": f"RULE#{rule_id}",
+        "pk": pk,
+        "sk": sk,
         "gsi1pk": "RULE",
-        "gsi1sk": f"ORG#{org_id}#RULE#{rule_id}",
+        "gsi1sk": f"{pk}#{sk}",
         "rule_id": rule_id,
         "name": rule["name"],
         "category": category,
@@ -94,25 +104,43 @@ def main(argv=None) -> int:
     category = seed["category"]
     version = seed["version"]
     rules = seed["rules"]
+    # One timestamp per run: every rule in a seed shares created/updated_at.
+    now = _now_iso()
 
     if not rules:
         print(f"No rules in {args.seed_file}; nothing to seed.")
         return 0
 
+    # Reject the whole file before any write: batch_writer flushes whatever it
+    # has buffered on exit, so a bad rule mid-loop would leave a partial seed.
+    bad = [str(rule.get("id", f"#{i}")) for i, rule in enumerate(rules)
+           if any(field not in rule for field in REQUIRED_RULE_FIELDS)]
+    if bad:
+        print(f"Rules missing {'/'.join(REQUIRED_RULE_FIELDS)} in {args.seed_file}: "
+              f"{', '.join(bad)}", file=sys.stderr)
+        return 1
+
     if args.dry_run:
         for rule in rules:
-            item = _rule_item(org_id=org_id, rule=rule, category=category, version=version)
+            item = _rule_item(org_id=org_id, rule=rule, category=category,
+                              version=version, now=now)
             print(f"[dry-run] would put rule {item['rule_id']} ({item['name']}) "
                   f"type={item['type']} enabled={item['enabled']}")
         print(f"[dry-run] {len(rules)} rule(s) would be upserted for {org_id}")
         return 0
 
-    table = boto3.resource("dynamodb", region_name=args.region).Table(TABLE_NAME)
-    for rule in rules:
-        item = _rule_item(org_id=org_id, rule=rule, category=category, version=version)
-        table.put_item(Item=item)
-        print(f"Upserted rule {item['rule_id']} ({item['name']}) "
-              f"type={item['type']} enabled={item['enabled']}")
+    table = boto3.resource(
+        "dynamodb", region_name=args.region, config=BOTO_CONFIG,
+    ).Table(TABLE_NAME)
+    # overwrite_by_pkeys collapses a rule id repeated in the seed file to its
+    # last occurrence; BatchWriteItem rejects duplicate keys in one request.
+    with table.batch_writer(overwrite_by_pkeys=["pk", "sk"]) as batch:
+        for rule in rules:
+            item = _rule_item(org_id=org_id, rule=rule, category=category,
+                              version=version, now=now)
+            batch.put_item(Item=item)
+            print(f"Upserted rule {item['rule_id']} ({item['name']}) "
+                  f"type={item['type']} enabled={item['enabled']}")
 
     print(f"Upserted {len(rules)} rules for {org_id}")
     return 0